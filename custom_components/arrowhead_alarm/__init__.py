@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 from dataclasses import dataclass
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 
 from .arrowhead_alarm_api import ArrowheadAlarmAPI
 from .const import DOMAIN
 from .coordinator import ArrowheadAlarmCoordinator
 from .services import async_setup_services
 
+# Every platform's entities are CoordinatorEntity subclasses fed by the panel's push
+# messages, so they never poll (should_poll is False) and must not override async_update.
 _PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
     Platform.BUTTON,
@@ -22,7 +27,7 @@ _PLATFORMS: list[Platform] = [
 type ArrowheadConfigEntry = ConfigEntry[RuntimeData]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RuntimeData:
     """Class to hold your data."""
 
@@ -37,16 +42,33 @@ async def async_setup_entry(
     host: str = config_entry.data[CONF_HOST]
     port: int = config_entry.data[CONF_PORT]
     api = ArrowheadAlarmAPI(host, port)
+    # A single session is held open for the life of the entry; release it on unload.
+    config_entry.async_on_unload(api.close_connection)
 
     coordinator = ArrowheadAlarmCoordinator(
         hass, api, config_entry.entry_id, config_entry.data
     )
 
-    await coordinator.async_config_entry_first_refresh()
-
     config_entry.runtime_data = RuntimeData(coordinator=coordinator)
 
-    await hass.config_entries.async_forward_entry_setups(config_entry, _PLATFORMS)
+    # Platform setup only needs the coordinator object, not its data, so overlap it
+    # with the first connection to the panel.
+    first_refresh = hass.async_create_task(
+        coordinator.async_config_entry_first_refresh()
+    )
+    try:
+        await hass.config_entries.async_forward_entry_setups(config_entry, _PLATFORMS)
+    except BaseException:
+        # Don't leave the refresh running on its own with its result never retrieved.
+        first_refresh.cancel()
+        with contextlib.suppress(asyncio.CancelledError, Exception):
+            await first_refresh
+        raise
+    try:
+        await first_refresh
+    except ConfigEntryNotReady:
+        await hass.config_entries.async_unload_platforms(config_entry, _PLATFORMS)
+        raise
 
     if not hass.services.has_service(DOMAIN, "disarm"):
         await async_setup_services(hass)
@@ -58,7 +80,12 @@ async def async_unload_entry(hass: HomeAssistant, entry: ArrowheadConfigEntry) -
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, _PLATFORMS)
 
-    if unload_ok:
+    # Services are shared by every panel, so only remove them with the last entry.
+    other_loaded = any(
+        other.entry_id != entry.entry_id and other.state is ConfigEntryState.LOADED
+        for other in hass.config_entries.async_entries(DOMAIN)
+    )
+    if unload_ok and not other_loaded:
         for service in ["bypass_zone", "unbypass_zone", "disarm"]:
             hass.services.async_remove(DOMAIN, service)
 
@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
-import asyncio
 import logging
 
 from homeassistant.components.alarm_control_panel import (
@@ -15,15 +15,26 @@ from homeassistant.components.alarm_control_panel import (
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.device_registry import DeviceInfo
 
 from . import ArrowheadConfigEntry
-from .const import DOMAIN
 from .coordinator import ArrowheadAlarmCoordinator, ArrowheadData
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=16)
+def _partition_attributes(status: str | None) -> dict[str, Any]:
+    """Return the state attributes for a partition status.
+
+    Only depends on the status, of which there are a handful, so each dict is built
+    once and shared. Home Assistant copies attributes when writing state.
+    """
+    return {
+        "ready_to_arm": status == "partition_ready",
+        "raw_status": status,
+    }
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ArrowheadConfigEntry,
@@ -46,16 +57,25 @@ class ArrowheadAlarmControlPanel(
         | AlarmControlPanelEntityFeature.ARM_NIGHT
     )
 
+    _STATE_MAP: dict[str, AlarmControlPanelState] = {
+        "partition_away_armed": AlarmControlPanelState.ARMED_AWAY,  # Matches 'A'
+        "partition_stay_armed": AlarmControlPanelState.ARMED_HOME,  # Matches 'S'
+        "partition_disarmed": AlarmControlPanelState.DISARMED,  # Matches 'D'
+        "partition_in_alarm": AlarmControlPanelState.TRIGGERED,  # Matches 'AA'
+        "partition_exit_away_timing": AlarmControlPanelState.ARMING,  # Matches 'EA'
+        "partition_exit_stay_timing": AlarmControlPanelState.ARMING,  # Matches 'ES'
+    }
+    # FALLBACK: If status is RO, NR, or AR, and it's not in the map above,
+    # it means the panel is telling us it's idle/disarmed.
+    _DISARMED_FALLBACK = frozenset(
+        {"partition_ready", "partition_not_ready", "partition_alarm_restored"}
+    )
+
     def __init__(self, coordinator: ArrowheadAlarmCoordinator) -> None:
         """Initialize the alarm control panel."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.entry_id}-alarm"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.entry_id)},
-            name="Arrowhead Alarm Panel",
-            manufacturer="Arrowhead",
-            model="ECi",
-        )
+        self._attr_device_info = coordinator.device_info
 
     @property
     def alarm_state(self) -> AlarmControlPanelState | None:
@@ -66,42 +86,17 @@ class ArrowheadAlarmControlPanel(
         if not status:
             return None
 
-        # In alarm_control_panel.py -> alarm_state property
-        mapping: dict[str, AlarmControlPanelState] = {
-            "partition_away_armed": AlarmControlPanelState.ARMED_AWAY,  # Matches 'A'
-            "partition_stay_armed": AlarmControlPanelState.ARMED_HOME,  # Matches 'S'
-            "partition_disarmed": AlarmControlPanelState.DISARMED,  # Matches 'D'
-            "partition_in_alarm": AlarmControlPanelState.TRIGGERED,  # Matches 'AA'
-            "partition_exit_away_timing": AlarmControlPanelState.ARMING,  # Matches 'EA'
-            "partition_exit_stay_timing": AlarmControlPanelState.ARMING,  # Matches 'ES'
-        }
-
-        if state := mapping.get(status):
+        if state := self._STATE_MAP.get(status):
             return state
-        # FALLBACK: If status is RO, NR, or AR, and it's not in the map above,
-        # it means the panel is telling us it's idle/disarmed.
-        if status in (
-            "partition_ready",
-            "partition_not_ready",
-            "partition_alarm_restored",
-        ):
+        if status in self._DISARMED_FALLBACK:
             return AlarmControlPanelState.DISARMED
 
         return None
 
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
-
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Add the 'Ready' status as an attribute."""
-        status = self.coordinator.data["partition_status"]
-        return {
-            "ready_to_arm": status == "partition_ready",
-            "raw_status": status,
-        }
+        return _partition_attributes(self.coordinator.data["partition_status"])
 
     @property
     def code_format(self) -> CodeFormat | None:
@@ -115,21 +110,26 @@ class ArrowheadAlarmControlPanel(
 
     async def async_alarm_disarm(self, code: str | None = None) -> None:
         """Send disarm command."""
-        if not code or not code.isdigit():
-            _LOGGER.warning("Disarm attempted without a valid numeric PIN")
-        else:
+        if not code:
+            _LOGGER.warning("Disarm attempted without a PIN")
+            return
+        try:
             await self.coordinator.api.disarm(pin=code, area=1)
-            await self.coordinator.async_refresh()
+        except ValueError:
+            _LOGGER.warning("Disarm attempted without a valid numeric PIN")
+            return
+        await self.coordinator.async_request_refresh()
+
+    # Arming needs no refresh: the panel pushes the exit timing and armed states
+    # (ES/EA, then S/A) over the open connection as they happen.
 
     async def async_alarm_arm_home(self, code: str | None = None) -> None:
         """Send arm home command."""
         await self.coordinator.api.arm_stay(area=1)
-        await self.coordinator.async_refresh()
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
         """Send arm away command."""
         await self.coordinator.api.arm_away(area=1)
-        await self.coordinator.async_refresh()
 
     async def async_alarm_arm_night(self, code: str | None = None) -> None:
         """Arm with custom bypass of zone 3. Customised specifcally for this site."""
@@ -138,8 +138,6 @@ class ArrowheadAlarmControlPanel(
             bypass_zone = int(code)
 
         _LOGGER.info("Bypassing zone %s via alarm panel", bypass_zone)
-        await self.coordinator.api.bypass_zone(bypass_zone)
-        # sleep for 1 second to make sure bypass makes it to alarm
-        await asyncio.sleep(1)
+        # Wait (up to 1 second) for the panel to confirm the bypass before arming
+        await self.coordinator.api.bypass_zone(bypass_zone, timeout=1)
         await self.coordinator.api.arm_stay(area=1)
-        await self.coordinator.async_refresh()
@@ -7,7 +7,21 @@ from collections.abc import Awaitable, Callable
 import contextlib
 import logging
 import re
-from typing import Literal, TypedDict
+from typing import Literal, NamedTuple, TypedDict
+
+from .const import (
+    ACK_SUCCESS_RESPONSE,
+    CMD_ARMAWAY,
+    CMD_ARMSTAY,
+    CMD_BYPASS,
+    CMD_DISARM,
+    CMD_MODE,
+    CMD_OUTPUT_ON,
+    CMD_STATUS,
+    CMD_UNBYPASS,
+    CONNECTION_TIMEOUT,
+    MSG_ACK_OK_TEXT,
+)
 
 
 class MessageData(TypedDict, total=False):
@@ -30,16 +44,34 @@ class TranslatedMessage(TypedDict):
     data: MessageData
 
 
+class ZoneStatusInfo(NamedTuple):
+    """Fixed-shape description of a zone message prefix."""
+
+    status_type: str
+    action: bool
+    description: str
+
+
 MODES = (1, 2, 3)
 DELIMITERS = ("\n", "\n\r", "\r\n", "\r")
-CMD_MODE = "MODE"
-CMD_ARMAWAY = "ARMAWAY"
-CMD_ARMSTAY = "ARMSTAY"
-CMD_DISARM = "DISARM"
-CMD_STATUS = "STATUS"
-CMD_BYPASS = "BYPASS"
-CMD_UNBYPASS = "UNBYPASS"
-CMD_TRIGGER_OUTPUT = "OUTPUTON"
+
+# Delimiters and fixed commands are encoded once rather than on every send.
+_DELIMITER_BYTES = tuple(delim.encode("ascii") for delim in DELIMITERS)
+_STATUS_COMMAND = CMD_STATUS.encode("ascii") + _DELIMITER_BYTES[0]
+_ACK = ACK_SUCCESS_RESPONSE.encode("ascii") + _DELIMITER_BYTES[0]
+
+# Any run of \r and \n ends a message, which covers every delimiter in DELIMITERS
+# (including a bare \r) and the empty lines between them.
+_LINE_SPLIT = re.compile(rb"[\r\n]+")
+# Matches the StreamReader's default limit; a longer partial line is discarded.
+_MAX_MESSAGE_BYTES = 2**16
+
+# Commands taking a single number are filled in with bytes %-formatting.
+_ARMAWAY_TEMPLATE = f"{CMD_ARMAWAY} %d".encode("ascii") + _DELIMITER_BYTES[0]
+_ARMSTAY_TEMPLATE = f"{CMD_ARMSTAY} %d".encode("ascii") + _DELIMITER_BYTES[0]
+_BYPASS_TEMPLATE = f"{CMD_BYPASS} %d".encode("ascii") + _DELIMITER_BYTES[0]
+_UNBYPASS_TEMPLATE = f"{CMD_UNBYPASS} %d".encode("ascii") + _DELIMITER_BYTES[0]
+_OUTPUT_ON_TEMPLATE = f"{CMD_OUTPUT_ON} %d".encode("ascii") + _DELIMITER_BYTES[0]
 
 
 # Map of message prefixes to their corresponding status type and state.
@@ -47,73 +79,21 @@ CMD_TRIGGER_OUTPUT = "OUTPUTON"
 # Note: ZCx (Closed) is a restoration of ZOx (Open). ZRx (Restored) is a restoration of ZAx (Alarm).
 ZONE_STATUS_MAP = {
     # Active/Alarm States (Set to True)
-    "ZA": {"status_type": "alarm", "action": True, "description": "Zone is in alarm"},
-    "ZBL": {
-        "status_type": "battery_low",
-        "action": True,
-        "description": "Radio zone battery is low",
-    },
-    "ZBY": {
-        "status_type": "bypassed",
-        "action": True,
-        "description": "Zone is bypassed",
-    },
-    "ZIA": {
-        "status_type": "sensor_watch_alarm",
-        "action": True,
-        "description": "Sensor watch alarm active",
-    },
-    "ZO": {
-        "status_type": "open",
-        "action": True,
-        "description": "Zone is open (un-sealed)",
-    },
-    "ZT": {
-        "status_type": "trouble",
-        "action": True,
-        "description": "Trouble alarm active",
-    },
-    "ZSA": {
-        "status_type": "supervise_alarm",
-        "action": True,
-        "description": "Supervise alarm active",
-    },
+    "ZA": ZoneStatusInfo("alarm", True, "Zone is in alarm"),
+    "ZBL": ZoneStatusInfo("battery_low", True, "Radio zone battery is low"),
+    "ZBY": ZoneStatusInfo("bypassed", True, "Zone is bypassed"),
+    "ZIA": ZoneStatusInfo("sensor_watch_alarm", True, "Sensor watch alarm active"),
+    "ZO": ZoneStatusInfo("open", True, "Zone is open (un-sealed)"),
+    "ZT": ZoneStatusInfo("trouble", True, "Trouble alarm active"),
+    "ZSA": ZoneStatusInfo("supervise_alarm", True, "Supervise alarm active"),
     # Restored/Cleared States (Set to False)
-    "ZBR": {
-        "status_type": "battery_low",
-        "action": False,
-        "description": "Radio zone battery restored",
-    },
-    "ZBYR": {
-        "status_type": "bypassed",
-        "action": False,
-        "description": "Zone bypass removed (un-bypassed)",
-    },
-    "ZC": {
-        "status_type": "open",
-        "action": False,
-        "description": "Zone is closed (sealed)",
-    },
-    "ZIR": {
-        "status_type": "sensor_watch_alarm",
-        "action": False,
-        "description": "Sensor watch alarm restored",
-    },
-    "ZR": {
-        "status_type": "alarm",
-        "action": False,
-        "description": "Zone alarm restored",
-    },
-    "ZTR": {
-        "status_type": "trouble",
-        "action": False,
-        "description": "Trouble alarm restored",
-    },
-    "ZSR": {
-        "status_type": "supervise_alarm",
-        "action": False,
-        "description": "Supervise alarm restored",
-    },
+    "ZBR": ZoneStatusInfo("battery_low", False, "Radio zone battery restored"),
+    "ZBYR": ZoneStatusInfo("bypassed", False, "Zone bypass removed (un-bypassed)"),
+    "ZC": ZoneStatusInfo("open", False, "Zone is closed (sealed)"),
+    "ZIR": ZoneStatusInfo("sensor_watch_alarm", False, "Sensor watch alarm restored"),
+    "ZR": ZoneStatusInfo("alarm", False, "Zone alarm restored"),
+    "ZTR": ZoneStatusInfo("trouble", False, "Trouble alarm restored"),
+    "ZSR": ZoneStatusInfo("supervise_alarm", False, "Supervise alarm restored"),
 }
 
 PARTITION_STATUS_MAP = {
@@ -134,10 +114,16 @@ OUTPUT_MAP = {
     "OR": "output_ready",
 }
 
-# Regex pattern to capture the prefix (2-4 characters) and the zone number (1-2 digits)
-# Example matches: 'ZA12', 'ZBYR1', 'ZO5'
+# Regex pattern to capture a known prefix and its zone/area/output number (1-2 digits)
+# Built from the maps above, longest prefix first, so unknown prefixes never match.
+# Example matches: 'ZA12', 'ZBYR1', 'ZO5', 'RO1'
 
-MESSAGE_PATTERN = re.compile(r"^([A-Z]{1,4})(\d{1,2})$")
+_MESSAGE_PREFIXES = sorted(
+    (*ZONE_STATUS_MAP, *PARTITION_STATUS_MAP, *OUTPUT_MAP), key=len, reverse=True
+)
+MESSAGE_PATTERN = re.compile(
+    rf"({'|'.join(_MESSAGE_PREFIXES)})(\d{{1,2}})", re.ASCII
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -159,18 +145,38 @@ class ArrowheadAlarmAPI:
         self.reader: asyncio.StreamReader | None = None
         self.writer: asyncio.StreamWriter | None = None
 
+        # Unbounded and never joined: get() only suspends when the queue is empty, so
+        # a burst of messages is handed over without any waiter futures.
         self._queue: asyncio.Queue[str] = asyncio.Queue()
 
         self._listen_task: asyncio.Task | None = None
         self._consumer_task: asyncio.Task | None = None
 
-        self._callbacks: list[Callable[[TranslatedMessage], Awaitable[None]]] = []
+        # Replaced rather than mutated on registration, so the consumer always
+        # iterates a consistent snapshot.
+        self._callbacks: tuple[Callable[[TranslatedMessage], Awaitable[None]], ...] = ()
+
+        # Serialises command writers (services, coordinator) so commands sent from
+        # concurrent tasks can never interleave on the wire. Listener acks skip it on
+        # purpose: _ack() is a single synchronous write() that cannot land inside a
+        # command's buffered bytes, and the listener must never wait on a drain.
+        self._write_lock = asyncio.Lock()
+
+        # Commands waiting for the panel to confirm a zone status, keyed by
+        # (zone, status_type, action).
+        self._pending_zone_updates: dict[
+            tuple[int, str, bool], asyncio.Future[None]
+        ] = {}
 
     def register_callback(
         self, cb: Callable[[TranslatedMessage], Awaitable[None]]
     ) -> None:
         """Registers a callback for incoming panel messages."""
-        self._callbacks.append(cb)
+        # Registering twice would handle every message twice. Bound methods of the
+        # same object compare equal, so a re-registered handler is caught here.
+        if cb in self._callbacks:
+            return
+        self._callbacks = (*self._callbacks, cb)
 
     @property
     def is_connected(self) -> bool:
@@ -183,7 +189,7 @@ class ArrowheadAlarmAPI:
 
         Parameter: user - allowed values 1 - 100
         """
-        if user not in range(1, 100):
+        if not 1 <= user <= 99:
             raise ValueError("User must be between 1 and 100.")
         cmd = f"P1E{user}={pin}"
 
@@ -192,7 +198,7 @@ class ArrowheadAlarmAPI:
     async def connect(self) -> None:
         """Establishes the connection."""
         try:
-            async with asyncio.timeout(10):
+            async with asyncio.timeout(CONNECTION_TIMEOUT):
                 self.reader, self.writer = await asyncio.open_connection(
                     self.host, self.port
                 )
@@ -222,14 +228,14 @@ class ArrowheadAlarmAPI:
             False if not
         """
 
-        if mode not in MODES:
-            raise ValueError("Mode must be 1, 2, or 3.")
+        await self._write(self._mode_command(mode))
 
-        # Our standard operating mode will be mode 2, which users \n for delimiter.
-        # For now we need to assume that we are in mode 1 and use a newline that works for both MODE 2 and MODE 1
-        cmd = f"{CMD_MODE} {mode}"
+    async def set_mode_and_request_status(self, mode: int = 2) -> None:
+        """Sets the mode and requests the status of the system in a single write.
 
-        await self._send_command(cmd, 2)
+        Parameter: mode - allowed values 1,2,3
+        """
+        await self._write(self._mode_command(mode), _STATUS_COMMAND)
 
     async def arm_away(self, area: int = 1) -> None:
         """Arms the system in away mode.
@@ -238,9 +244,7 @@ class ArrowheadAlarmAPI:
             area - the area to be armed.
         """
 
-        cmd = f"{CMD_ARMAWAY} {area}"
-
-        await self._send_command(cmd)
+        await self._write(_ARMAWAY_TEMPLATE % area)
 
     async def arm_stay(self, area: int = 1) -> None:
         """Arms the system in stay mode.
@@ -249,30 +253,37 @@ class ArrowheadAlarmAPI:
             area - the area to be armed.
         """
 
-        cmd = f"{CMD_ARMSTAY} {area}"
-
-        await self._send_command(cmd)
+        await self._write(_ARMSTAY_TEMPLATE % area)
 
-    async def disarm(self, pin: str, area: int = 1) -> None:
+    async def disarm(self, pin: str | int, area: int = 1) -> None:
         """Disarms the system.
 
         Parameters:
-            pin - the pin to disarm the system.
+            pin - the pin to disarm the system, ASCII digits only.
             area - the area to be disarmed.
         """
+        pin = str(pin)
+        # isdigit() alone also accepts non-ASCII digits, which the panel cannot parse.
+        if not (pin.isascii() and pin.isdecimal()):
+            raise ValueError("PIN must only contain the digits 0-9.")
 
         cmd = f"{CMD_DISARM} {area} {pin}"
 
         await self._send_command(cmd)
 
-    async def bypass_zone(self, zone: int) -> None:
+    async def bypass_zone(self, zone: int, timeout: float | None = None) -> None:
         """Bypasses a zone.
 
         Parameters:
             zone - the zone to be bypassed.
+            timeout - if given, wait up to this many seconds for the panel to
+                      confirm the bypass (ZBY) before returning.
         """
-        cmd = f"{CMD_BYPASS} {zone}"
-        await self._send_command(cmd)
+        cmd = _BYPASS_TEMPLATE % zone
+        if timeout is None:
+            await self._write(cmd)
+        else:
+            await self._send_and_wait_for_zone(cmd, zone, "bypassed", True, timeout)
 
     async def unbypass_zone(self, zone: int) -> None:
         """Unbypasses a zone.
@@ -280,8 +291,7 @@ class ArrowheadAlarmAPI:
         Parameters:
             zone - the zone to be unbypassed.
         """
-        cmd = f"{CMD_UNBYPASS} {zone}"
-        await self._send_command(cmd)
+        await self._write(_UNBYPASS_TEMPLATE % zone)
 
     async def trigger_output(self, output: int) -> None:
         """Triggers an output.
@@ -290,13 +300,11 @@ class ArrowheadAlarmAPI:
             output - the output to be triggered.
         """
         _LOGGER.info("Triggered Output: %s", output)
-        cmd = f"{CMD_TRIGGER_OUTPUT} {output}"
-        await self._send_command(cmd)
+        await self._write(_OUTPUT_ON_TEMPLATE % output)
 
     async def request_status(self) -> None:
         """Requests the status of the system."""
-        cmd = CMD_STATUS
-        await self._send_command(cmd)
+        await self._write(_STATUS_COMMAND)
 
     async def listen(self) -> None:
         """Listens for incoming messages from the Alarm Panel."""
@@ -310,24 +318,32 @@ class ArrowheadAlarmAPI:
                 if not data:
                     _LOGGER.warning("Alarm panel closed the connection")
                     break
-                buffer += data
-                buffer = self._normalize_delimiter(buffer)
 
-                while DELIMITERS[0].encode("ascii") in buffer:
-                    # Extract complete message
-                    line, buffer = buffer.split(DELIMITERS[0].encode("ascii"), 1)
-                    message = line.decode("ascii", errors="replace")
+                # The last piece is an incomplete message (or empty) and is kept.
+                *lines, buffer = _LINE_SPLIT.split(buffer + data)
+                for line in lines:
+                    message = line.strip().decode("ascii", errors="replace")
+                    if not message:
+                        continue
 
                     # Acknowledge receipt
-                    await self._ack()
+                    self._ack()
 
                     self._queue.put_nowait(message)
 
+                if len(buffer) > _MAX_MESSAGE_BYTES:
+                    _LOGGER.warning("Discarding oversized message from Alarm Panel")
+                    buffer = b""
+
         except asyncio.CancelledError:
             _LOGGER.debug("Listening task cancelled")
             raise
-        except Exception as e:
-            _LOGGER.error("Connection error in listener: %s", e)
+        except OSError as e:
+            # Expected when the panel or the network drops the socket; no traceback needed
+            _LOGGER.warning("Connection error in listener: %s", e)
+            raise
+        except Exception:
+            _LOGGER.exception("Unexpected error in listener")
             raise
         finally:
             self._queue.put_nowait("STOP")
@@ -339,11 +355,17 @@ class ArrowheadAlarmAPI:
             message = await self._queue.get()
 
             data = self._translate_message(message)
+            if data and data["type"] == "zone":
+                self._resolve_pending_zone_update(data["data"])
 
             try:
                 # Notify all registered callbacks
-                if data:
-                    await asyncio.gather(*(cb(data) for cb in self._callbacks))
+                # Normally the coordinator is the only callback, which needs no gather.
+                if data and (callbacks := self._callbacks):
+                    if len(callbacks) == 1:
+                        await callbacks[0](data)
+                    else:
+                        await asyncio.gather(*[cb(data) for cb in callbacks])
             except Exception as e:
                 # Yes we are catching a generic exception here, but reasons:
                 # 1. We don't expect it to fail and this is not production code.
@@ -354,24 +376,30 @@ class ArrowheadAlarmAPI:
 
                 # We don't know what state we might have missed, so force a resync.
                 await self.request_status()
-            finally:
-                self._queue.task_done()
 
     async def close_connection(self) -> None:
         """Closes the connection to the Alarm Panel."""
 
-        # Cancel tasks
-        for task in [self._listen_task, self._consumer_task]:
-            if task and not task.done():
-                task.cancel()
-                with contextlib.suppress(asyncio.CancelledError):
-                    await task
+        # Cancel both tasks together so shutdown waits on the slower one, not the sum.
+        tasks = [
+            task
+            for task in (self._listen_task, self._consumer_task)
+            if task and not task.done()
+        ]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
         self._listen_task = None
         self._consumer_task = None
         if self.writer:
+            # close() already flushes what is buffered; a peer that has dropped the
+            # socket makes wait_closed raise, which must not abort the unload.
             self.writer.close()
-            await self.writer.wait_closed()
+            with contextlib.suppress(OSError):
+                await self.writer.wait_closed()
+        self.reader = None
+        self.writer = None
 
     async def _send_command(self, command: str, delimiter_index: int = 0) -> None:
         r"""Sends a command to the Alarm Panel.
@@ -379,79 +407,120 @@ class ArrowheadAlarmAPI:
         Parameter: command - the command to send
                    delimiter_index - delimiter index to use (default 0 = \n), options 0, 1, 2
         """
-        if not self.writer:
-            raise ConnectionError("Not connected to the Alarm Panel.")
-        if delimiter_index not in [0, 1, 2]:
+        if not 0 <= delimiter_index <= 2:
             raise ValueError("Delimiter index must be 0, 1, or 2.")
 
-        cmd = f"{command}{DELIMITERS[delimiter_index]}"
-        b_cmd = cmd.encode("ascii")
-        self.writer.write(b_cmd)
-        await self.writer.drain()
+        await self._write(command.encode("ascii") + _DELIMITER_BYTES[delimiter_index])
 
-    async def _ack(self) -> None:
-        """Sends an acknowledgment to the Alarm Panel."""
-        if self.writer:
-            self.writer.write(b"OK\n")
+    async def _write(self, *payloads: bytes) -> None:
+        """Writes already encoded commands to the Alarm Panel with a single drain."""
+        if not self.writer:
+            raise ConnectionError("Not connected to the Alarm Panel.")
+
+        async with self._write_lock:
+            self.writer.writelines(payloads)
             await self.writer.drain()
 
-    def _normalize_delimiter(self, data: bytes) -> bytes:
-        r"""Normalizes delimiters in the incoming data to use only \n."""
-        for delim in DELIMITERS[1:]:
-            data = data.replace(delim.encode("ascii"), DELIMITERS[0].encode("ascii"))
-        return data
+    def _mode_command(self, mode: int) -> bytes:
+        """Returns the encoded MODE command for the given mode."""
+        if mode not in MODES:
+            raise ValueError("Mode must be 1, 2, or 3.")
+
+        # Our standard operating mode will be mode 2, which users \n for delimiter.
+        # For now we need to assume that we are in mode 1 and use a newline that works for both MODE 2 and MODE 1
+        return f"{CMD_MODE} {mode}".encode("ascii") + _DELIMITER_BYTES[2]
+
+    async def _send_and_wait_for_zone(
+        self, command: bytes, zone: int, status_type: str, action: bool, timeout: float
+    ) -> None:
+        """Sends a command and waits for the panel to report the resulting zone status.
+
+        Gives up quietly after timeout seconds, as the panel does not echo a status
+        that is already in effect.
+        """
+        key = (zone, status_type, action)
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending_zone_updates[key] = future
+        try:
+            await self._write(command)
+            async with asyncio.timeout(timeout):
+                await future
+        except asyncio.TimeoutError:
+            _LOGGER.debug(
+                "Alarm Panel did not confirm %s=%s for zone %s",
+                status_type,
+                action,
+                zone,
+            )
+        finally:
+            if self._pending_zone_updates.get(key) is future:
+                del self._pending_zone_updates[key]
+
+    def _resolve_pending_zone_update(self, data: MessageData) -> None:
+        """Wakes any command waiting for this zone status."""
+        key = (data["zone_id"], data["status_type"], data["action"])
+        if (future := self._pending_zone_updates.pop(key, None)) and not future.done():
+            future.set_result(None)
+
+    def _ack(self) -> None:
+        """Sends an acknowledgment to the Alarm Panel.
+
+        Not drained: an ack is a few bytes, write() buffers it whole so it cannot split
+        a command, and the next command write drains it along with everything else.
+        """
+        if self.writer:
+            self.writer.write(_ACK)
 
     def _translate_message(self, message: str) -> TranslatedMessage | None:
         """Translates a raw message into a structured dict, included a type key."""
 
-        raw_message = message.strip().upper()
+        # listen() has already stripped the line, and the panel sends upper case.
+        raw_message = message if message.isupper() else message.upper()
 
         # OK at the start of a message will signify a response, normally we just want to ignore this unless in specific cases below
-        if "OK STATUS" in raw_message:  # Note: This usually signifies a sync start
-            return {"type": "sync_start", "data": {}}
-
-        if "OK OUTPUTON" in raw_message:
-            return {
-                "type": "command_response",
-                "data": {"status": "success", "command": "output"},
-            }
+        if raw_message.startswith(MSG_ACK_OK_TEXT):
+            # The panel may echo arguments after the command (e.g. OK OUTPUTON 1),
+            # so only the first word identifies the response.
+            response = raw_message[len(MSG_ACK_OK_TEXT) + 1 :].partition(" ")[0]
+            if response == CMD_STATUS:  # Note: This usually signifies a sync start
+                return {"type": "sync_start", "data": {}}
+
+            if response == CMD_OUTPUT_ON:
+                return {
+                    "type": "command_response",
+                    "data": {"status": "success", "command": "output"},
+                }
 
-        if raw_message[:2] == "OK":
             return None
 
         # Handle ERR Responses (e.g., ERR 1, ERR 05)
         if raw_message.startswith("ERR"):
             try:
-                err_code = int(raw_message.split()[1])
-                return {  # noqa: TRY300
-                    "type": "command_response",
-                    "data": {"status": "error", "code": err_code},
-                }
+                err_code = int(raw_message[3:].split(maxsplit=1)[0])
             except (IndexError, ValueError):
-                return {
-                    "type": "command_response",
-                    "data": {"status": "error", "code": 0},
-                }
+                err_code = 0
+            return {
+                "type": "command_response",
+                "data": {"status": "error", "code": err_code},
+            }
 
-        if msg_match := MESSAGE_PATTERN.match(raw_message):
+        if msg_match := MESSAGE_PATTERN.fullmatch(raw_message):
             prefix, numeric_id = msg_match.groups()
 
-            if prefix in ("OO", "OR"):
+            if prefix in OUTPUT_MAP:
                 # Response to Control Command. Don't really care about these in our case
                 # as the one control doesn't retain any state, just triggers an action.
                 return None
             # Then check if it's a zone
             if status_info := ZONE_STATUS_MAP.get(prefix):
-                if status_info:
-                    zone_id = int(numeric_id)
-                    return {
-                        "type": "zone",
-                        "data": {
-                            "zone_id": zone_id,
-                            "status_type": status_info["status_type"],
-                            "action": status_info["action"],
-                        },
-                    }
+                return {
+                    "type": "zone",
+                    "data": {
+                        "zone_id": int(numeric_id),
+                        "status_type": status_info.status_type,
+                        "action": status_info.action,
+                    },
+                }
             elif status_string := PARTITION_STATUS_MAP.get(prefix):
                 return {
                     "type": "partition",
@@ -4,14 +4,13 @@ import logging
 from typing import Any
 
 from homeassistant.components.binary_sensor import BinarySensorEntity
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import ArrowheadConfigEntry
-from .const import DOMAIN, ZONE_NAME, ZONE_NUMBER, ZONE_TYPE, ZONES
-from .coordinator import ArrowheadAlarmCoordinator
+from .const import ZONE_NAME, ZONE_NUMBER, ZONE_TYPE, ZONES
+from .coordinator import ArrowheadAlarmCoordinator, ZoneStatus
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,9 +26,9 @@ async def async_setup_entry(
 
     configured_zones = config_entry.data[ZONES]
 
-    # Create a sensors list.
+    # Create a sensor for each configured zone.
     async_add_entities(
-        [ArrowheadBinarySensor(coordinator, zone) for zone in configured_zones]
+        ArrowheadBinarySensor(coordinator, zone) for zone in configured_zones
     )
 
 
@@ -39,63 +38,62 @@ class ArrowheadBinarySensor(
     """A binary sensor for an Arrowhead Alarm Zone."""
 
     def __init__(
-        self, coordinator: ArrowheadAlarmCoordinator, zone_config: dict
+        self, coordinator: ArrowheadAlarmCoordinator, zone_config: dict[str, Any]
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._zone_id: int = int(zone_config[ZONE_NUMBER])
+        # The config flow schema has already coerced the zone number to int.
+        self._zone_id: int = zone_config[ZONE_NUMBER]
         self._attr_name = zone_config[ZONE_NAME]
         self._attr_device_class = zone_config[ZONE_TYPE]
         self._attr_unique_id = f"{coordinator.entry_id}_zone_{self._zone_id}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.entry_id)},
-            name="Arrowhead Alarm Panel",
-            manufacturer="Arrowhead",
-            model="ECi",
+        self._attr_device_info = coordinator.device_info
+        self._update_from_zone(coordinator.data["zones"][self._zone_id])
+        self._last_written: tuple[bool, bool, bool, bool] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the zone's state once per update, writing it only if it changed."""
+        zone_data = self.coordinator.data["zones"][self._zone_id]
+        # Availability follows the coordinator, so it is part of what gets written.
+        written = (
+            zone_data["open"],
+            zone_data["bypassed"],
+            zone_data["alarm"],
+            self.coordinator.last_update_success,
         )
+        if written == self._last_written:
+            return
+        self._last_written = written
+        self._update_from_zone(zone_data)
+        super()._handle_coordinator_update()
+
+    def _update_from_zone(self, zone_data: ZoneStatus) -> None:
+        """Set the state, attributes and icon from the zone's status."""
+        # True if the zone is Open/Active.
+        self._attr_is_on = zone_data["open"]
+        self._attr_extra_state_attributes = {
+            "is_bypassed": zone_data["bypassed"],
+            "in_alarm": zone_data["alarm"],
+        }
+        if zone_data["alarm"]:
+            # Use a distinctive icon for zones in alarm
+            self._attr_icon = "mdi:alarm-light"
+        elif zone_data["bypassed"]:
+            self._attr_icon = "mdi:shield-off-outline"
+        else:
+            # Fallback to the default icon for motion/open sensors
+            self._attr_icon = None
 
     async def async_bypass_zone(self) -> None:
         """Service call to bypass this specific zone."""
-        _LOGGER.info("Bypassing zone %s", self._zone_id)
+        _LOGGER.debug("Bypassing zone %s", self._zone_id)
         await self.coordinator.api.bypass_zone(self._zone_id)
-        # Refresh to update the 'is_bypassed' attribute in the UI
-        await self.coordinator.async_refresh()
+        # Show the 'is_bypassed' attribute straight away rather than polling for it
+        self.coordinator.async_set_zone_bypassed(self._zone_id, True)
 
     async def async_unbypass_zone(self) -> None:
         """Service call to unbypass this specific zone."""
-        _LOGGER.info("Unbypassing zone %s", self._zone_id)
+        _LOGGER.debug("Unbypassing zone %s", self._zone_id)
         await self.coordinator.api.unbypass_zone(self._zone_id)
-        await self.coordinator.async_refresh()
-
-    @property
-    def is_on(self) -> bool:
-        """Return True if the zone is Open/Active."""
-        # This looks into the dictionary provided by the coordinator
-        # Structure expected: {'zones': {1: True, 2: False}}
-        return self.coordinator.data["zones"][self._zone_id]["open"]
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return attributes to display in the UI."""
-
-        zone_data = self.coordinator.data["zones"][self._zone_id]
-
-        return {
-            "is_bypassed": zone_data["bypassed"],
-            "in_alarm": zone_data["alarm"],
-        }
-
-    @property
-    def icon(self) -> str | None:
-        """Return the icon to use in the frontend."""
-        # Check the state from the extra_state_attributes property's logic
-        zone_data = self.coordinator.data["zones"][self._zone_id]
-
-        if zone_data["alarm"]:
-            # Use a distinctive icon for bypassed zones
-            return "mdi:alarm-light"
-        if zone_data["bypassed"]:
-            return "mdi:shield-off-outline"
-
-        # Fallback to the default icon for motion/open sensors
-        return None
+        self.coordinator.async_set_zone_bypassed(self._zone_id, False)
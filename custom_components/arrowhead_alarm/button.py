@@ -2,17 +2,17 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import ArrowheadConfigEntry
-from .const import CONTROL_NAME, CONTROL_NUMBER, CONTROLS, DOMAIN
+from .const import CONTROL_NAME, CONTROL_NUMBER, CONTROLS
 from .coordinator import ArrowheadAlarmCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,15 +28,14 @@ async def async_setup_entry(
 
     configured_controls = config_entry.data[CONTROLS]
 
-    controls = [
+    async_add_entities(
         ArrowheadButton(
             coordinator=coordinator,
             control_id=control[CONTROL_NUMBER],
             name=control[CONTROL_NAME],
         )
         for control in configured_controls
-    ]
-    async_add_entities(controls)
+    )
 
 
 class ArrowheadButton(CoordinatorEntity[ArrowheadAlarmCoordinator], ButtonEntity):
@@ -48,22 +47,18 @@ class ArrowheadButton(CoordinatorEntity[ArrowheadAlarmCoordinator], ButtonEntity
         """Initialize the button."""
         super().__init__(coordinator)
         self._control_id = control_id
+        self._trigger = partial(coordinator.api.trigger_output, control_id)
         self._attr_name = name
         self._attr_unique_id = f"{coordinator.entry_id}_control_{control_id}"
         self._attr_has_entity_name = True
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.entry_id)},
-            name="Arrowhead Alarm Panel",
-            manufacturer="Arrowhead",
-            model="ECi",
-        )
+        self._attr_device_info = coordinator.device_info
 
     async def async_press(self) -> None:
         """Handle the button press."""
 
         try:
-            await self.coordinator.api.trigger_output(self._control_id)
+            await self._trigger()
         except ConnectionError as err:
             _LOGGER.error("Failed to trigger output %s: %s", self._control_id, err)
             raise HomeAssistantError(
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 from typing import Any
 
 import voluptuous as vol
@@ -21,8 +22,8 @@ from homeassistant.helpers.selector import (
     TextSelectorType,
 )
 
-from .arrowhead_alarm_api import ArrowheadAlarmAPI
 from .const import (
+    CONNECTION_TIMEOUT,
     CONTROL_COUNT,
     CONTROL_NAME,
     CONTROL_NUMBER,
@@ -41,25 +42,65 @@ _LOGGER = logging.getLogger(__name__)
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
-        vol.Required(CONF_PORT): int,
+        vol.Required(CONF_PORT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=65535)
+        ),
     }
 )
 
+STEP_ENTITY_COUNTS_SCHEMA = vol.Schema(
+    {
+        vol.Required(ZONE_COUNT, default=1): vol.All(
+            vol.Coerce(int),
+            vol.Range(min=0, max=32),
+        ),
+        vol.Required(CONTROL_COUNT, default=0): vol.All(
+            vol.Coerce(int),
+            vol.Range(min=0, max=4),
+        ),
+    }
+)
+
+# The zone and control steps are shown once per item; the per-item defaults are
+# filled in as suggested values so these schemas are only built once.
+STEP_ZONE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ZONE_NUMBER): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Required(ZONE_NAME): str,
+        vol.Required(ZONE_TYPE): SelectSelector(
+            SelectSelectorConfig(options=ZONE_TYPES, mode=SelectSelectorMode.DROPDOWN)
+        ),
+    }
+)
+
+STEP_CONTROL_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONTROL_NUMBER): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Required(CONTROL_NAME): str,
+    }
+)
+
+# Whitespace or a slash (e.g. a pasted http:// URL) can never be part of a host.
+_INVALID_HOST_RE = re.compile(r"[\s/]")
+
 
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, str]:
     """Validate the user input is correct.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
-    # Create a temporary API instance just to test connection
-    api = ArrowheadAlarmAPI(data[CONF_HOST], data[CONF_PORT])
+    # Reject obvious typos before waiting on a connection attempt
+    if not data[CONF_HOST] or _INVALID_HOST_RE.search(data[CONF_HOST]):
+        raise InvalidHost
 
     try:
-        # Attempt connection
-        async with asyncio.timeout(10):
-            await api.connect()
+        # Only reachability matters here, so open a bare socket rather than starting
+        # the API's listener and consumer tasks just to cancel them again.
+        async with asyncio.timeout(CONNECTION_TIMEOUT):
+            _, writer = await asyncio.open_connection(data[CONF_HOST], data[CONF_PORT])
             # If successful, close it immediately
-            await api.close_connection()
+            writer.close()
+            await writer.wait_closed()
     except Exception as err:
         _LOGGER.error("Failed to connect: %s", err)
         raise CannotConnect from err
@@ -91,6 +132,8 @@ class ArrowHeadConfigFlow(ConfigFlow, domain=DOMAIN):
                 info = await validate_input(self.hass, user_input)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
+            except InvalidHost:
+                errors["base"] = "invalid_host"
             except InvalidAuth:
                 errors["base"] = "invalid_auth"
             except Exception:
@@ -113,19 +156,6 @@ class ArrowHeadConfigFlow(ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Allows user to enter the number of zones."""
-        schema = vol.Schema(
-            {
-                vol.Required(ZONE_COUNT, default=1): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=0, max=32),
-                ),
-                vol.Required(CONTROL_COUNT, default=0): vol.All(
-                    vol.Coerce(int),
-                    vol.Range(min=0, max=4),
-                ),
-            }
-        )
-
         if user_input is not None:
             self._zone_count = int(user_input[ZONE_COUNT])
             self._control_count = int(user_input[CONTROL_COUNT])
@@ -140,7 +170,9 @@ class ArrowHeadConfigFlow(ConfigFlow, domain=DOMAIN):
 
             return await self.async_step_setup_controls()
 
-        return self.async_show_form(step_id="setup_entity_counts", data_schema=schema)
+        return self.async_show_form(
+            step_id="setup_entity_counts", data_schema=STEP_ENTITY_COUNTS_SCHEMA
+        )
 
     async def async_step_setup_panel(
         self, user_input: dict[str, Any] | None = None
@@ -191,23 +223,16 @@ class ArrowHeadConfigFlow(ConfigFlow, domain=DOMAIN):
 
         current_index = len(self._configured_zones) + 1
 
-        schema = vol.Schema(
-            {
-                vol.Required(ZONE_NUMBER, default=current_index): vol.All(
-                    vol.Coerce(int), vol.Range(min=1)
-                ),
-                vol.Required(ZONE_NAME, default=f"Zone {current_index}"): str,
-                vol.Required(ZONE_TYPE, default=ZONE_TYPES[0]): SelectSelector(
-                    SelectSelectorConfig(
-                        options=ZONE_TYPES, mode=SelectSelectorMode.DROPDOWN
-                    )
-                ),
-            }
-        )
-
         return self.async_show_form(
             step_id="setup_zones",
-            data_schema=schema,
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_ZONE_SCHEMA,
+                {
+                    ZONE_NUMBER: current_index,
+                    ZONE_NAME: f"Zone {current_index}",
+                    ZONE_TYPE: ZONE_TYPES[0],
+                },
+            ),
             description_placeholders={
                 "index": str(current_index),
                 "count": str(self._zone_count),
@@ -232,18 +257,15 @@ class ArrowHeadConfigFlow(ConfigFlow, domain=DOMAIN):
 
         current_index = len(self._configured_controls) + 1
 
-        schema = vol.Schema(
-            {
-                vol.Required(CONTROL_NUMBER, default=current_index): vol.All(
-                    vol.Coerce(int), vol.Range(min=1)
-                ),
-                vol.Required(CONTROL_NAME, default=f"Control {current_index}"): str,
-            }
-        )
-
         return self.async_show_form(
             step_id="setup_controls",
-            data_schema=schema,
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_CONTROL_SCHEMA,
+                {
+                    CONTROL_NUMBER: current_index,
+                    CONTROL_NAME: f"Control {current_index}",
+                },
+            ),
             description_placeholders={
                 "index": str(current_index),
                 "count": str(self._control_count),
@@ -267,6 +289,8 @@ class ArrowHeadConfigFlow(ConfigFlow, domain=DOMAIN):
                 await validate_input(self.hass, user_input)
             except CannotConnect:
                 errors["base"] = "cannot_connect"
+            except InvalidHost:
+                errors["base"] = "invalid_host"
             else:
                 return self.async_update_reload_and_abort(
                     config_entry, data={**config_entry.data, **user_input}
@@ -284,5 +308,9 @@ class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
 
 
+class InvalidHost(HomeAssistantError):
+    """Error to indicate the host is malformed."""
+
+
 class InvalidAuth(HomeAssistantError):
     """Error to indicate there is invalid auth."""
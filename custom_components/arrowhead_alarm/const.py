@@ -3,6 +3,9 @@
 DOMAIN = "arrowhead_alarm"
 DEFAULT_SCAN_INTERVAL = 60
 
+# Overall budget, in seconds, for connecting to the panel (and the commands sent with it)
+CONNECTION_TIMEOUT = 10
+
 CONTROLS = "controls"
 CONTROL_COUNT = "control_count"
 CONTROL_NUMBER = "control_number"
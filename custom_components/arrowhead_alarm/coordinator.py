@@ -1,19 +1,58 @@
 """Data Coordinator for AAP integration."""
 
+from __future__ import annotations
+
 import asyncio
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from datetime import timedelta
 import logging
 from typing import Any, Literal, TypedDict, cast
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_SCAN_INTERVAL
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .arrowhead_alarm_api import ArrowheadAlarmAPI, TranslatedMessage
-from .const import ZONE_NUMBER, ZONES
+from .arrowhead_alarm_api import ArrowheadAlarmAPI, MessageData, TranslatedMessage
+from .const import (
+    CONNECTION_TIMEOUT,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    ZONE_NUMBER,
+    ZONES,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Longest a status dump may hold back zone updates if its closing partition status
+# never arrives (e.g. the connection drops mid-dump).
+_SYNC_FLUSH_DELAY = 0.5
+
+# Partition statuses that an idle/readiness report must not overwrite.
+_ARMED_STATES = frozenset(
+    {
+        "partition_away_armed",
+        "partition_stay_armed",
+        "partition_in_alarm",
+        "partition_exit_away_timing",
+        "partition_exit_stay_timing",
+    }
+)
+_RESTORE_STATES = frozenset(
+    {
+        "partition_ready",
+        "partition_alarm_restored",
+        "partition_not_ready",
+        "output_on",
+        "output_ready",
+    }
+)
+# Every (current, new) pair where the new status is ignored.
+_SHIELDED_TRANSITIONS = frozenset(
+    (current, new) for current in _ARMED_STATES for new in _RESTORE_STATES
+)
+
 
 class ZoneStatus(TypedDict):
     """Type definition for individual zone status."""
@@ -23,6 +62,10 @@ class ZoneStatus(TypedDict):
     bypassed: bool
 
 
+# Shared by every cleared zone. Safe because zone dicts are replaced, never mutated.
+_CLEARED_ZONE = ZoneStatus(open=False, alarm=False, bypassed=False)
+
+
 class ArrowheadData(TypedDict):
     """Type defintition for the coordinator's data."""
 
@@ -44,13 +87,30 @@ class ArrowheadAlarmCoordinator(DataUpdateCoordinator[ArrowheadData]):
 
         self.api = api
         self.entry_id = entry_id
+        # Every entity belongs to the one panel device, so they all share this.
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, entry_id)},
+            name="Arrowhead Alarm Panel",
+            manufacturer="Arrowhead",
+            model="ECi",
+        )
 
         self.configured_zones = config_data.get(ZONES, [])
+        self._zone_ids: frozenset[int] = frozenset(
+            z[ZONE_NUMBER] for z in self.configured_zones
+        )
 
         self._sync_in_progress = False
         self._received_zones: set[int] = set()
+        # Zones the current status dump reported as bypassed.
+        self._received_bypasses: set[int] = set()
+        # Zone updates in a status dump are held back and published in one go with
+        # the partition status that follows them.
+        self._defer_zone_updates = False
+        self._has_deferred_update = False
+        self._cancel_sync_flush: CALLBACK_TYPE | None = None
 
-        scan_interval = config_data.get("scan_interval", 60)
+        scan_interval = config_data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
 
         super().__init__(
             hass,
@@ -59,154 +119,244 @@ class ArrowheadAlarmCoordinator(DataUpdateCoordinator[ArrowheadData]):
             update_interval=timedelta(seconds=scan_interval),
         )
 
+        # Seed the data so entities can be created before the first refresh completes.
+        self.data = self._get_initial_data()
+
         self.api.register_callback(self._async_handle_api_message)
 
     def _get_initial_data(self) -> ArrowheadData:
         """Return the default data structure."""
-        zones_init: dict[int, ZoneStatus] = {
-            int(z[ZONE_NUMBER]): ZoneStatus(open=False, alarm=False, bypassed=False)
-            for z in self.configured_zones
-        }
+        zones_init: dict[int, ZoneStatus] = dict.fromkeys(self._zone_ids, _CLEARED_ZONE)
         return {
-            "partition_status": "partition_disarmed",
+            # Unknown until the panel's first status dump reports it.
+            "partition_status": None,
             "zones": zones_init,
         }
 
-    async def _async_handle_api_message(self, message: TranslatedMessage) -> None:
-        """Process push messages from the API."""
-
-        msg_type = message["type"]
-        msg_data = message["data"]
+    @callback
+    def async_set_zone_bypassed(self, zone_id: int, bypassed: bool) -> None:
+        """Optimistically record a bypass change the panel has just been sent.
 
-        # Handle Command Responses (Success/Error)
-        if msg_type == "command_response" and msg_data:
-            if msg_data.get("status", None) == "error":
-                _LOGGER.error(
-                    "Alarm Panel returned Error Code: %s", msg_data.get("code", "")
-                )
-                # Optional: Fire a Home Assistant event so you can trigger a notification
-                self.hass.bus.fire(
-                    "arrowhead_alarm_error", {"code": msg_data.get("code", "")}
-                )
-            else:
-                _LOGGER.debug(
-                    "Alarm Panel Command Successful: %s", msg_data.get("command")
-                )
+        The panel's own ZBY/ZBYR message, or the end of the next status dump,
+        reconciles it.
+        """
+        zones = self.data["zones"]
+        if zone_id not in zones or zones[zone_id]["bypassed"] == bypassed:
             return
 
-        if not self.data:
-            self.data = self._get_initial_data()
-        if not msg_data and msg_type != "sync_start":
-            return
+        cur_zone = cast(ZoneStatus, dict(zones[zone_id]))
+        cur_zone["bypassed"] = bypassed
+        self.async_set_updated_data(
+            {
+                "partition_status": self.data["partition_status"],
+                "zones": {**zones, zone_id: cur_zone},
+            }
+        )
 
-        # Create a shallow copy of the data dictionary to ensure HA sees the update
-        new_data: ArrowheadData = {
+    async def _async_handle_api_message(self, message: TranslatedMessage) -> None:
+        """Process push messages from the API."""
+        if handler := self._MESSAGE_HANDLERS.get(message["type"]):
+            handler(self, message["data"])
+
+    def _copy_data(self) -> ArrowheadData:
+        """Return a copy of the data to change, so HA sees the update."""
+        # Shallow: a zone's dict is replaced, never mutated, when it changes.
+        return {
             "partition_status": self.data["partition_status"],
             "zones": dict(self.data["zones"]),
         }
 
-        # --- HANDLE SYNC START ---
-        if msg_type == "sync_start":
-            self._sync_in_progress = True
-            self._received_zones.clear()
-            return  # No need to update state yet
-
+    def _handle_command_response(self, msg_data: MessageData) -> None:
+        """Handle Command Responses (Success/Error)."""
         if not msg_data:
             return
 
-        # --- HANDLE ZONE UPDATES ---
-        if msg_type == "zone":
-            zone_id = int(msg_data.get("zone_id", 0))
-            status_key: Literal["open", "alarm", "bypassed"] = cast(
-                Literal["open", "alarm", "bypassed"], msg_data.get("status_type")
+        if msg_data.get("status", None) == "error":
+            _LOGGER.error(
+                "Alarm Panel returned Error Code: %s", msg_data.get("code", "")
             )
-            action: bool = msg_data.get("action", False)
-
-            # If we are in the middle of a status dump, track this zone ID
-            if self._sync_in_progress:
-                self._received_zones.add(zone_id)
-
-            # Update the zone in our data structure
-            if zone_id in new_data["zones"]:
-                cur_zone = cast(ZoneStatus, dict(new_data["zones"][zone_id]))
-                cur_zone[status_key] = action  # type: ignore[literal-required]
-                new_data["zones"][zone_id] = cur_zone
-
-            if status_key == "alarm":
-                if action:
-                    _LOGGER.info(
-                        "Zone %s triggered alarm. Promoting partition to in_alarm",
-                        zone_id,
-                    )
-                    new_data["partition_status"] = "partition_in_alarm"
-                else:
-                    other_alarms = any(
-                        z["alarm"]
-                        for zid, z in new_data["zones"].items()
-                        if zid != zone_id
-                    )
-                    if (
-                        not other_alarms
-                        and new_data["partition_status"] == "partition_in_alarm"
-                    ):
-                        _LOGGER.info(
-                            "All zone alarms cleared. Restoring partition status"
-                        )
-                        new_data["partition_status"] = "partition_disarmed"
-        # --- HANDLE PARTITION UPDATES & SYNC CLEANUP ---
-        elif msg_type == "partition":
-            new_status = cast(str, msg_data.get("status"))
-            current_status = new_data["partition_status"]
-
-            armed_states = [
-                "partition_away_armed",
-                "partition_stay_armed",
-                "partition_in_alarm",
-                "partition_exit_away_timing",
-                "partition_exit_stay_timing",
-            ]
-
-            if current_status in armed_states and new_status in [
-                "partition_ready",
-                "partition_alarm_restored",
-                "partition_not_ready",
-                "output_on",
-                "output_ready",
-            ]:
-                _LOGGER.debug(
-                    "Shielding armed state '%s' from incoming '%s' message",
-                    current_status,
-                    new_status,
+            # Optional: Fire a Home Assistant event so you can trigger a notification
+            self.hass.bus.fire(
+                "arrowhead_alarm_error", {"code": msg_data.get("code", "")}
+            )
+        else:
+            _LOGGER.debug("Alarm Panel Command Successful: %s", msg_data.get("command"))
+
+    def _handle_sync_start(self, msg_data: MessageData) -> None:
+        """Start tracking the zones reported in a status dump."""
+        # Publish anything still held back by an earlier dump before starting over.
+        if self._stop_deferring():
+            self.async_set_updated_data(self.data)
+
+        self._sync_in_progress = True
+        self._received_zones.clear()
+        self._received_bypasses.clear()
+        # No need to update state yet
+        self._defer_zone_updates = True
+        self._cancel_sync_flush = async_call_later(
+            self.hass, _SYNC_FLUSH_DELAY, self._async_flush_deferred
+        )
+
+    def _stop_deferring(self) -> bool:
+        """Stop holding back zone updates; return True if any are unpublished."""
+        if self._cancel_sync_flush:
+            self._cancel_sync_flush()
+            self._cancel_sync_flush = None
+        has_deferred_update = self._has_deferred_update
+        self._defer_zone_updates = self._has_deferred_update = False
+        return has_deferred_update
+
+    @callback
+    def _async_flush_deferred(self, _now: Any) -> None:
+        """Publish zone updates from a status dump whose partition never arrived."""
+        self._cancel_sync_flush = None
+        if self._stop_deferring():
+            self.async_set_updated_data(self.data)
+
+    def _handle_zone(self, msg_data: MessageData) -> None:
+        """Apply a zone update."""
+        if not msg_data:
+            return
+
+        zone_id = int(msg_data.get("zone_id", 0))
+        status_key: Literal["open", "alarm", "bypassed"] = cast(
+            Literal["open", "alarm", "bypassed"], msg_data.get("status_type")
+        )
+        action: bool = msg_data.get("action", False)
+
+        # If we are in the middle of a status dump, track this zone ID
+        if self._sync_in_progress:
+            self._received_zones.add(zone_id)
+            if status_key == "bypassed" and action:
+                self._received_bypasses.add(zone_id)
+
+        # Status dumps mostly repeat what we already hold. Alarms are always applied,
+        # as they also drive the partition status.
+        if status_key != "alarm" and (
+            zone_id not in self._zone_ids
+            or self.data["zones"][zone_id].get(status_key) == action
+        ):
+            return
+
+        new_data = self._copy_data()
+        zones = new_data["zones"]
+        # Update the zone in our data structure
+        if zone_id in self._zone_ids:
+            cur_zone = cast(ZoneStatus, dict(zones[zone_id]))
+            cur_zone[status_key] = action  # type: ignore[literal-required]
+            zones[zone_id] = cur_zone
+
+        if status_key == "alarm":
+            if action:
+                _LOGGER.info(
+                    "Zone %s triggered alarm. Promoting partition to in_alarm",
+                    zone_id,
                 )
+                new_data["partition_status"] = "partition_in_alarm"
             else:
-                new_data["partition_status"] = new_status
+                other_alarms = any(
+                    z["alarm"] for zid, z in zones.items() if zid != zone_id
+                )
+                if (
+                    not other_alarms
+                    and new_data["partition_status"] == "partition_in_alarm"
+                ):
+                    _LOGGER.info("All zone alarms cleared. Restoring partition status")
+                    new_data["partition_status"] = "partition_disarmed"
+
+        if self._defer_zone_updates and status_key != "alarm":
+            # Keep the change without waking every entity; it goes out with the
+            # partition status that ends the dump. Alarms are never held back.
+            self.data = new_data
+            self._has_deferred_update = True
+            return
+
+        # Any change held back from the dump goes out with this one.
+        self._has_deferred_update = False
+        # This pushes the update to all entities (binary sensors, switches, alarm panel)
+        self.async_set_updated_data(new_data)
+
+    def _handle_partition(self, msg_data: MessageData) -> None:
+        """Apply a partition update, cleaning up after a status dump."""
+        if not msg_data:
+            return
+
+        new_status = cast(str, msg_data.get("status"))
+        current_status = self.data["partition_status"]
+        ends_sync = new_status == "partition_ready" and self._sync_in_progress
+        # Zone updates held back during a status dump go out with this message.
+        publish_deferred = self._stop_deferring()
+
+        if (current_status, new_status) in _SHIELDED_TRANSITIONS:
+            _LOGGER.debug(
+                "Shielding armed state '%s' from incoming '%s' message",
+                current_status,
+                new_status,
+            )
+            if not (ends_sync or publish_deferred):
+                # Nothing changes, so there is nothing to build or publish.
+                return
+            new_status = current_status
 
-            # Handle Sync Cleanup during a status dump
-            if new_status == "partition_ready" and self._sync_in_progress:
-                for zid in new_data["zones"]:
-                    if zid not in self._received_zones:
-                        new_data["zones"][zid] = ZoneStatus(
-                            open=False, alarm=False, bypassed=False
-                        )
+        # Zones are shared with the current data; only the cleanup below replaces them.
+        new_data: ArrowheadData = {
+            "partition_status": new_status,
+            "zones": self.data["zones"],
+        }
 
-                self._sync_in_progress = False
+        # Handle Sync Cleanup during a status dump
+        if ends_sync:
+            zones = new_data["zones"]
+            # The dump lists every bypassed zone, so a reported zone it did not list
+            # as bypassed is not (e.g. the panel refused an optimistic bypass).
+            unbypassed = {
+                zone_id: cast(ZoneStatus, {**zones[zone_id], "bypassed": False})
+                for zone_id in self._received_zones - self._received_bypasses
+                if zone_id in self._zone_ids and zones[zone_id]["bypassed"]
+            }
+            if missing := self._zone_ids - self._received_zones:
+                unbypassed.update(dict.fromkeys(missing, _CLEARED_ZONE))
+            if unbypassed:
+                new_data["zones"] = {**zones, **unbypassed}
+
+            self._sync_in_progress = False
+
+        # Repeated statuses (e.g. RO after every status dump) change nothing, so
+        # skip waking the entities unless deferred zone updates are still pending.
+        if (
+            not publish_deferred
+            and new_status == current_status
+            and new_data["zones"] is self.data["zones"]
+        ):
+            return
 
-        # --- 4. FINALIZE ---
         # This pushes the update to all entities (binary sensors, switches, alarm panel)
         self.async_set_updated_data(new_data)
 
+    # Looked up once per message instead of testing each type in turn.
+    _MESSAGE_HANDLERS: dict[
+        str, Callable[[ArrowheadAlarmCoordinator, MessageData], None]
+    ] = {
+        "command_response": _handle_command_response,
+        "sync_start": _handle_sync_start,
+        "zone": _handle_zone,
+        "partition": _handle_partition,
+    }
+
     async def _async_update_data(self) -> ArrowheadData:
         """Called periodically and during setup to connect and start listener."""
 
         try:
-            async with asyncio.timeout(10):
+            async with asyncio.timeout(CONNECTION_TIMEOUT):
                 if not self.api.is_connected:
+                    # A dump cut short by the disconnect must not hold back updates
+                    # from the new connection; the returned data publishes its changes.
+                    self._sync_in_progress = False
+                    self._stop_deferring()
                     await self.api.connect()
-                    await self.api.set_mode(2)
-                await self.api.request_status()
-
-            if self.data is None:
-                return self._get_initial_data()
+                    await self.api.set_mode_and_request_status(2)
+                else:
+                    await self.api.request_status()
 
             return self.data  # noqa: TRY300
 
@@ -2,6 +2,7 @@
 
 import voluptuous as vol
 
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import config_validation as cv
 
@@ -21,47 +22,57 @@ SERVICE_DISARM_SCHEMA = vol.Schema(
 )
 
 
-async def async_setup_services(hass: HomeAssistant) -> None:
-    """Setup the services for the Arrowhead Alarm Integration."""
+def _get_coordinator(call: ServiceCall) -> ArrowheadAlarmCoordinator | None:
+    """Return the coordinator of the first loaded panel, if any."""
+    # For a single-panel setup, we grab the first loaded entry
+    # and its typed coordinator from runtime_data
+    for entry in call.hass.config_entries.async_entries(DOMAIN):
+        if entry.state is ConfigEntryState.LOADED:
+            return entry.runtime_data.coordinator
+    return None
+
+
+# The handlers only send the command: the panel pushes the resulting zone or
+# partition status, so there is nothing to refresh afterwards. Bypasses are shown
+# straight away and reconciled by that push.
+async def handle_bypass_zone(call: ServiceCall) -> None:
+    """Handle the bypass_zone service call."""
+    if coordinator := _get_coordinator(call):
+        await coordinator.api.bypass_zone(call.data["zone_id"])
+        coordinator.async_set_zone_bypassed(call.data["zone_id"], True)
 
-    async def handle_alarm_action(call: ServiceCall):
-        """Handle the service call."""
-        config_entries = hass.config_entries.async_entries(DOMAIN)
 
-        if not config_entries:
-            return
+async def handle_unbypass_zone(call: ServiceCall) -> None:
+    """Handle the unbypass_zone service call."""
+    if coordinator := _get_coordinator(call):
+        await coordinator.api.unbypass_zone(call.data["zone_id"])
+        coordinator.async_set_zone_bypassed(call.data["zone_id"], False)
 
-        # For a single-panel setup, we grab the first loaded entry
-        # and its typed coordinator from runtime_data
-        config_entry = config_entries[0]
-        coordinator: ArrowheadAlarmCoordinator = config_entry.runtime_data.coordinator
 
-        zone_id: int | None = call.data.get("zone_id")
-        pin: int | None = call.data.get("pin")
+async def handle_disarm(call: ServiceCall) -> None:
+    """Handle the disarm service call."""
+    if coordinator := _get_coordinator(call):
+        await coordinator.api.disarm(call.data["pin"])
 
-        if call.service == "bypass_zone" and zone_id:
-            await coordinator.api.bypass_zone(zone_id)
-        elif call.service == "unbypass_zone" and zone_id:
-            await coordinator.api.unbypass_zone(zone_id)
-        elif call.service == "disarm" and pin:
-            await coordinator.api.disarm(pin)
-        await coordinator.async_refresh()
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Setup the services for the Arrowhead Alarm Integration."""
 
     hass.services.async_register(
         DOMAIN,
         "bypass_zone",
-        handle_alarm_action,
+        handle_bypass_zone,
         schema=SERVICE_BYPASS_SCHEMA,
     )
     hass.services.async_register(
         DOMAIN,
         "unbypass_zone",
-        handle_alarm_action,
+        handle_unbypass_zone,
         schema=SERVICE_BYPASS_SCHEMA,
     )
     hass.services.async_register(
         DOMAIN,
         "disarm",
-        handle_alarm_action,
+        handle_disarm,
         schema=SERVICE_DISARM_SCHEMA,
     )